@@ -35,6 +35,16 @@ from adafruit_register.i2c_struct import ROUnaryStruct, UnaryStruct
 from micropython import const
 
 try:
+    # MicroPython can sleep in whole milliseconds without a float conversion
+    from time import sleep_ms as _sleep_ms
+except ImportError:
+
+    def _sleep_ms(ms: int) -> None:
+        time.sleep(ms / 1000)
+
+
+try:
+    from array import array
     from typing import Tuple
 
     from busio import I2C
@@ -56,6 +66,31 @@ _MMC5603_CTRL_REG0 = const(0x1B)  # Register address for control 0
 _MMC5603_CTRL_REG1 = const(0x1C)  # Register address for control 1
 _MMC5603_CTRL_REG2 = const(0x1D)  # Register address for control 2
 
+_MMC5603_MAG_OFFSET = const(0x80000)  # Raw 20-bit reading at zero field
+_MMC5603_MEAS_M_TIME_MS = const(7)  # Datasheet mag measurement time is 6.6 ms at BW=00
+
+
+def _decode_mag_into(buf: bytearray, out: list, index: int = 0) -> None:
+    """Unpack the 20-bit X, Y, Z readings from OUT_X_L..OUT_XYZ2 as centered
+    counts into ``out[index:index + 3]`` without allocating"""
+    out[index] = (buf[0] << 12 | buf[1] << 4 | buf[6] >> 4) - _MMC5603_MAG_OFFSET
+    out[index + 1] = (buf[2] << 12 | buf[3] << 4 | buf[7] >> 4) - _MMC5603_MAG_OFFSET
+    out[index + 2] = (buf[4] << 12 | buf[5] << 4 | buf[8] >> 4) - _MMC5603_MAG_OFFSET
+
+
+def _convert_temp(raw: int) -> float:
+    """Convert a raw OUT_TEMP reading to degrees C"""
+    temp = raw * 0.8  # 0.8*C / LSB
+    temp -= 75  # 0 value is -75
+    return temp
+
+
+def _scale_mag_into(out: list, index: int = 0) -> None:
+    """Scale the centered counts in ``out[index:index + 3]`` to uT by LSB in datasheet"""
+    out[index] *= 0.00625
+    out[index + 1] *= 0.00625
+    out[index + 2] *= 0.00625
+
 
 class MMC5603:
     """Driver for the MMC5603 3-axis magnetometer.
@@ -83,6 +118,16 @@ class MMC5603:
 
         mag_x, mag_y, mag_z = sensor.magnetic
 
+    At high sample rates the I2C transfers dominate each reading, and `board.I2C`
+    often runs at 100 kHz. On microcontrollers you can use a faster bus where your
+    wiring allows it. On Linux the frequency argument is ignored, as the bus speed
+    is set by the OS:
+
+    .. code-block:: python
+
+        import busio
+        i2c = busio.I2C(board.SCL, board.SDA, frequency=400_000)
+
     :param ~busio.I2C i2c_bus: The I2C bus the MMC5603 is connected to.
     :param int address: The I2C device address. Defaults to :const:`0x30`
     """
@@ -93,11 +138,8 @@ class MMC5603:
     _ctrl2_reg = UnaryStruct(_MMC5603_CTRL_REG2, "<B")
     _status_reg = ROUnaryStruct(_MMC5603_STATUS_REG, "<B")
     _odr_reg = UnaryStruct(_MMC5603_ODR_REG, "<B")
-    _raw_temp_data = ROUnaryStruct(_MMC5603_OUT_TEMP, "<B")
 
     _reset = RWBit(_MMC5603_CTRL_REG1, 7)
-    _meas_m_done = RWBit(_MMC5603_STATUS_REG, 6)
-    _meas_t_done = RWBit(_MMC5603_STATUS_REG, 7)
 
     def __init__(self, i2c_bus: I2C, address: int = _MMC5603_I2CADDR_DEFAULT) -> None:
         # pylint: disable=no-member
@@ -106,55 +148,148 @@ class MMC5603:
             raise RuntimeError("Failed to find MMC5603 - check your wiring!")
 
         self.reset()
-        self._buffer = bytearray(9)
+        # register pointers are kept apart from the read buffers so the
+        # address byte is never overwritten by incoming data
+        self._mag_addr = bytes([_MMC5603_OUT_X_L])
+        # OUT_X_L..OUT_XYZ2, plus OUT_TEMP which directly follows them
+        self._buffer = bytearray(10)
+        self._temp_addr = bytes([_MMC5603_OUT_TEMP])
+        self._temp_buf = bytearray(1)
+        # measurement triggers and status polling bypass the register
+        # descriptors, which allocate on every access
+        self._tm_m_cmd = bytes([_MMC5603_CTRL_REG0, 0x01])  # TM_M
+        self._tm_t_cmd = bytes([_MMC5603_CTRL_REG0, 0x02])  # TM_T
+        self._status_addr = bytes([_MMC5603_STATUS_REG])
+        self._status_buf = bytearray(1)
+        # decoded X, Y, Z scratch so the read paths don't build intermediate tuples
+        self._xyz = [0, 0, 0]
         # self.performance_mode = PerformanceMode.MODE_ULTRA
 
     def reset(self) -> None:
         """Reset the sensor to the default state set by the library"""
         self._ctrl1_reg = 0x80  # write only, set topmost bit
-        time.sleep(0.020)
+        _sleep_ms(20)
         self._odr_cache = 0
         self._ctrl2_cache = 0
+        self._continuous = False
         self.set_reset()
 
+    def _wait_status(self, i2c: i2c_device.I2CDevice, mask: int, name: str) -> None:
+        """Poll the status register until a measurement done bit is set"""
+        write_then_readinto = i2c.write_then_readinto
+        status_addr = self._status_addr
+        status = self._status_buf
+        for _ in range(40):  # give up after ~40 ms
+            write_then_readinto(status_addr, status)
+            if status[0] & mask:
+                return
+            _sleep_ms(1)
+        raise RuntimeError(f"Timed out waiting for {name} measurement")
+
+    def _measure_mag(self, i2c: i2c_device.I2CDevice) -> None:
+        """Trigger a magnetometer measurement and wait for it to complete"""
+        i2c.write(self._tm_m_cmd)
+        # wait out the measurement time so the status register is usually only read once
+        _sleep_ms(_MMC5603_MEAS_M_TIME_MS)
+        self._wait_status(i2c, 0x40, "magnetic")  # meas_m_done
+
+    def _measure_temp(self, i2c: i2c_device.I2CDevice) -> None:
+        """Trigger a temperature measurement and wait for it to complete"""
+        i2c.write(self._tm_t_cmd)
+        self._wait_status(i2c, 0x80, "temperature")  # meas_t_done
+
     @property
     def temperature(self) -> float:
         """The processed temperature sensor value, returned in floating point C"""
-        if self.continuous_mode:
+        if self._continuous:
             raise RuntimeError("Can only read temperature when not in continuous mode")
-        self._ctrl0_reg = 0x02  # TM_T
-        while not self._meas_t_done:
-            time.sleep(0.005)
-        temp = self._raw_temp_data
-        temp *= 0.8  # 0.8*C / LSB
-        temp -= 75  # 0 value is -75
-        return temp
+        with self.i2c_device as i2c:
+            self._measure_temp(i2c)
+            i2c.write_then_readinto(self._temp_addr, self._temp_buf)
+        return _convert_temp(self._temp_buf[0])
+
+    def _read_mag_data(self) -> None:
+        """Take a magnetometer measurement if needed and read it into the buffer"""
+        with self.i2c_device as i2c:
+            # in continuous mode the chip keeps the output registers fresh on its own
+            if not self._continuous:
+                self._measure_mag(i2c)
+            i2c.write_then_readinto(self._mag_addr, self._buffer, in_end=9)
 
     @property
     def magnetic(self) -> Tuple[float, float, float]:
         """The processed magnetometer sensor values.
         A 3-tuple of X, Y, Z axis values in microteslas that are signed floats.
         """
-        if not self.continuous_mode:
-            self._ctrl0_reg = 0x01  # TM_M
+        self._read_mag_data()
+        xyz = self._xyz
+        _decode_mag_into(self._buffer, xyz)
+        _scale_mag_into(xyz)
+        return (xyz[0], xyz[1], xyz[2])
 
-            while not self._meas_m_done:
-                time.sleep(0.005)
-        self._buffer[0] = _MMC5603_OUT_X_L
+    @property
+    def magnetic_raw(self) -> Tuple[int, int, int]:
+        """The magnetometer sensor values as centered integer counts.
+        A 3-tuple of X, Y, Z axis values that are signed ints, 0.00625 uT (1/160 uT)
+        per LSB. Useful on boards without a hardware FPU, where the conversion
+        to floats can be done only when needed.
+        """
+        self._read_mag_data()
+        xyz = self._xyz
+        _decode_mag_into(self._buffer, xyz)
+        return (xyz[0], xyz[1], xyz[2])
+
+    def read_all(self) -> Tuple[Tuple[float, float, float], float]:
+        """Take a magnetometer and a temperature measurement and read both back
+        in a single burst. Returns a 2-tuple of the :attr:`magnetic` 3-tuple and
+        the :attr:`temperature` value. Can only be used when not in continuous mode.
+        """
+        if self._continuous:
+            raise RuntimeError("Can only use read_all when not in continuous mode")
+        buf = self._buffer
         with self.i2c_device as i2c:
-            i2c.write_then_readinto(self._buffer, self._buffer, out_end=1)
-        x = self._buffer[0] << 12 | self._buffer[1] << 4 | self._buffer[6] >> 4
-        y = self._buffer[2] << 12 | self._buffer[3] << 4 | self._buffer[7] >> 4
-        z = self._buffer[4] << 12 | self._buffer[5] << 4 | self._buffer[8] >> 4
-        # fix center offsets
-        x -= 1 << 19
-        y -= 1 << 19
-        z -= 1 << 19
-        # scale to uT by LSB in datasheet
-        x *= 0.00625
-        y *= 0.00625
-        z *= 0.00625
-        return (x, y, z)
+            self._measure_mag(i2c)
+            self._measure_temp(i2c)
+            i2c.write_then_readinto(self._mag_addr, buf)
+        xyz = self._xyz
+        _decode_mag_into(buf, xyz)
+        _scale_mag_into(xyz)
+        return ((xyz[0], xyz[1], xyz[2]), _convert_temp(buf[9]))
+
+    def stream_into(self, out: array, count: int, period_us: int = 0) -> None:
+        """Read ``count`` magnetometer samples back to back into ``out``.
+
+        Each sample is stored as X, Y, Z in microteslas, so ``out`` must hold at
+        least ``3 * count`` floats, e.g. ``array.array("f", [0] * (3 * count))``.
+
+        :param array.array out: The buffer to fill with samples.
+        :param int count: The number of samples to read.
+        :param int period_us: The time between the start of each sample in
+            microseconds, or 0 to read back to back. In continuous mode the
+            output registers only update at :attr:`data_rate`, so reading faster
+            than that repeats samples. A period near ``1_000_000 // data_rate``
+            gives roughly one sample per update, but it is timed by the host
+            clock rather than the chip's own. Pacing needs `time.monotonic_ns`,
+            which is missing on builds without long integer support.
+        """
+        if len(out) < 3 * count:
+            raise ValueError("Buffer too small for the requested number of samples")
+        buf = self._buffer
+        period_ns = period_us * 1000
+        deadline = time.monotonic_ns() if period_ns else 0
+        for i in range(0, 3 * count, 3):
+            if period_ns:
+                # sleep through most of the wait, then spin the last ms for accuracy
+                remaining = deadline - time.monotonic_ns() - 1_000_000
+                if remaining > 0:
+                    time.sleep(remaining / 1_000_000_000)
+                while time.monotonic_ns() < deadline:
+                    pass
+                deadline += period_ns
+            self._read_mag_data()
+            # decode straight into out rather than building a tuple per sample
+            _decode_mag_into(buf, out, i)
+            _scale_mag_into(out, i)
 
     @property
     def data_rate(self) -> int:
@@ -181,7 +316,7 @@ class MMC5603:
         """Whether or not to put the chip in continous mode - be sure
         to set the data_rate as well!
         """
-        return self._ctrl2_cache & 0x10
+        return self._continuous
 
     @continuous_mode.setter
     def continuous_mode(self, value: bool) -> None:
@@ -191,10 +326,11 @@ class MMC5603:
         else:
             self._ctrl2_cache &= ~0x10  # turn off cmm_en bit
         self._ctrl2_reg = self._ctrl2_cache
+        self._continuous = bool(value)
 
     def set_reset(self) -> None:
         """Pulse large currents through the sense coils to clear any offset"""
         self._ctrl0_reg = 0x08  # turn on set bit
-        time.sleep(0.001)  # 1 ms
+        _sleep_ms(1)
         self._ctrl0_reg = 0x10  # turn on reset bit
-        time.sleep(0.001)  # 1 ms
+        _sleep_ms(1)